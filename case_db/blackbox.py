@@ -1,33 +1,237 @@
 # case_db/blackbox.py
 from __future__ import annotations
 
+import copy
 import json
 import os
 import sqlite3
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from collections.abc import Sequence as SequenceABC
+from contextlib import contextmanager
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
 
 
 def _json_default(obj: Any):
     # Make JSON robust (fixes "set is not JSON serializable")
     if isinstance(obj, set):
         return sorted(list(obj))
+    if is_dataclass(obj) and not isinstance(obj, type):
+        # Slotted dataclasses (events, hits, entities) have no __dict__.
+        # Like orjson, skip private and init=False fields (internal
+        # caches rather than data).
+        return {
+            f.name: getattr(obj, f.name)
+            for f in fields(obj)
+            if f.init and not f.name.startswith("_")
+        }
+    if isinstance(obj, SequenceABC) and not isinstance(obj, (str, bytes, bytearray)):
+        # Read-only sequences such as TTFR.snapshot()'s SnapshotView
+        return list(obj)
+    if hasattr(obj, "_asdict"):
+        # Blackbox records (WorkOrder, ...) are NamedTuples
+        return obj._asdict()
     if hasattr(obj, "__dict__"):
         return obj.__dict__
     return str(obj)
 
 
-def dumps_json(data: Any) -> str:
-    return json.dumps(data, sort_keys=True, default=_json_default)
+def _records_to_dicts(data: Any) -> Any:
+    # stdlib json encodes tuple subclasses as arrays without consulting
+    # `default`, so NamedTuple records are converted up front.
+    if isinstance(data, tuple) and hasattr(data, "_asdict"):
+        return {k: _records_to_dicts(v) for k, v in data._asdict().items()}
+    if isinstance(data, (list, tuple)):
+        return [_records_to_dicts(v) for v in data]
+    if isinstance(data, dict):
+        return {k: _records_to_dicts(v) for k, v in data.items()}
+    return data
+
+
+def dumps_json_safe(data: Any) -> str:
+    """
+    Canonical encoder for user-controlled data (evidence refs, tags):
+    sorted keys, tolerant of sets and arbitrary objects.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=_json_default,
+        ).decode("utf-8")
+    return json.dumps(
+        _records_to_dicts(data), sort_keys=True, default=_json_default
+    )
+
+
+# Historical name; kept for existing importers.
+dumps_json = dumps_json_safe
+
+
+# Pre-encoded value for audit rows without details (matches the column
+# default), so they skip the encoder entirely.
+_EMPTY_DETAILS = "{}"
+
+
+def dumps_json_fast(data: Dict[str, Any]) -> str:
+    """
+    Encoder for developer-built dicts of JSON primitives (audit details):
+    no key sorting and no default hook, so both orjson and stdlib json
+    stay on their C fast path. Insertion order is already stable.
+    """
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data)
 
 
 def loads_json(s: str) -> Any:
-    return json.loads(s) if s else None
+    if not s:
+        return None
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
+
+
+_SCALARS = (str, int, float, bool, type(None))
 
 
-@dataclass(frozen=True)
-class WorkOrder:
+@lru_cache(maxsize=4096)
+def _parse_refs(s: str) -> Tuple[Any, bool]:
+    # Dashboards re-list the same rows constantly; decode each distinct
+    # stored JSON value once. The cached value is shared, so it is
+    # returned with a flag saying whether it holds only immutable scalars
+    # (a shallow copy is then enough to hand it out).
+    data = loads_json(s)
+    if isinstance(data, list):
+        return data, all(isinstance(v, _SCALARS) for v in data)
+    return data, isinstance(data, _SCALARS)
+
+
+def _stored_list(json_str: str) -> Any:
+    """
+    Decoded refs/tags column; always a fresh object the caller may mutate.
+    """
+    data, flat = _parse_refs(json_str)
+    if not data:
+        return []
+    if flat:
+        return list(data) if isinstance(data, list) else data
+    # Nested refs (e.g. dicts): never hand out the cached containers.
+    return copy.deepcopy(data)
+
+
+# Explicit column lists, in record field order, so rows can be passed
+# positionally instead of going through dict(row) + keyword dispatch.
+_WO_COLS = (
+    "id, case_id, snapshot_id, title, description, category, priority, status, "
+    "owner, due_at, evidence_refs_json, created_at, updated_at"
+)
+_ENTRY_COLS = (
+    "id, case_id, snapshot_id, entry_type, title, body, tags_json, "
+    "evidence_refs_json, created_by, created_at"
+)
+_ATTR_COLS = (
+    "id, case_id, snapshot_id, origin, confidence, rationale, evidence_refs_json, "
+    "analyst_override, updated_by, updated_at"
+)
+_AUDIT_COLS = "id, actor, action, details_json, created_at"
+
+
+# Statement text is kept in module constants: sqlite3 caches prepared
+# statements per connection keyed on the SQL string, so with the cached
+# connection each statement is parsed and planned once per process.
+_SQL_INSERT_AUDIT = """
+    INSERT INTO audit_log(case_id, snapshot_id, actor, action, details_json, created_at)
+    VALUES(?, ?, ?, ?, ?, ?)
+"""
+_SQL_LIST_AUDIT = f"""
+    SELECT {_AUDIT_COLS} FROM audit_log
+    WHERE case_id = ? AND snapshot_id = ?
+    ORDER BY id DESC
+    LIMIT ?
+"""
+_SQL_INSERT_WO = """
+    INSERT INTO work_orders(
+        case_id, snapshot_id, title, description, category,
+        priority, status, owner, due_at, evidence_refs_json,
+        created_at, updated_at
+    )
+    VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_LIST_WO = f"""
+    SELECT {_WO_COLS} FROM work_orders
+    WHERE case_id = ? AND snapshot_id = ?
+    ORDER BY updated_at DESC, id DESC
+"""
+_SQL_GET_WO_STATUS = "SELECT case_id, snapshot_id, status FROM work_orders WHERE id = ?"
+_SQL_UPDATE_WO_STATUS = "UPDATE work_orders SET status = ?, updated_at = ? WHERE id = ?"
+# Audits a status change straight from the current row (RETURNING only
+# sees post-update values, so the audit must read "from" before the
+# UPDATE).
+_SQL_AUDIT_WO_STATUS = """
+    INSERT INTO audit_log(case_id, snapshot_id, actor, action, details_json, created_at)
+    SELECT case_id, snapshot_id, ?, 'work_order_status_updated',
+           json_object('from', status, 'to', ?, 'work_order_id', id), ?
+    FROM work_orders WHERE id = ?
+"""
+# JSON functions are built into SQLite from 3.38.
+_HAS_JSON = sqlite3.sqlite_version_info >= (3, 38, 0)
+_SQL_INSERT_ENTRY = """
+    INSERT INTO blackbox_entries(
+        case_id, snapshot_id, entry_type, title, body,
+        tags_json, evidence_refs_json, created_by, created_at
+    )
+    VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_LIST_ENTRIES = f"""
+    SELECT {_ENTRY_COLS} FROM blackbox_entries
+    WHERE case_id = ? AND snapshot_id = ?
+    ORDER BY id DESC
+    LIMIT ?
+"""
+_SQL_UPSERT_ATTR = """
+    INSERT INTO attribution_assessments(
+        case_id, snapshot_id, origin, confidence, rationale,
+        evidence_refs_json, analyst_override, updated_by, updated_at
+    )
+    VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(case_id, snapshot_id) DO UPDATE SET
+        origin = excluded.origin,
+        confidence = excluded.confidence,
+        rationale = excluded.rationale,
+        evidence_refs_json = excluded.evidence_refs_json,
+        analyst_override = excluded.analyst_override,
+        updated_by = excluded.updated_by,
+        updated_at = excluded.updated_at
+"""
+_SQL_GET_ATTR = f"SELECT {_ATTR_COLS} FROM attribution_assessments WHERE case_id = ? AND snapshot_id = ?"
+
+
+# Bump when the DDL in BlackboxDAO._init_schema changes; stored in the
+# database file as PRAGMA user_version.
+_SCHEMA_VERSION = 2
+
+# Database paths already bootstrapped by this process.
+_SCHEMA_INITIALIZED: Set[str] = set()
+
+def _iter_rows(cur: sqlite3.Cursor, size: int = 1000):
+    while True:
+        rows = cur.fetchmany(size)
+        if not rows:
+            return
+        yield from rows
+
+
+# Records are NamedTuples: immutable like a frozen dataclass, but built
+# straight from a result row with _make() at C speed.
+class WorkOrder(NamedTuple):
     id: int
     case_id: str
     snapshot_id: str
@@ -44,11 +248,10 @@ class WorkOrder:
 
     @property
     def evidence_refs(self) -> Any:
-        return loads_json(self.evidence_refs_json) or []
+        return _stored_list(self.evidence_refs_json)
 
 
-@dataclass(frozen=True)
-class BlackboxEntry:
+class BlackboxEntry(NamedTuple):
     id: int
     case_id: str
     snapshot_id: str
@@ -62,15 +265,14 @@ class BlackboxEntry:
 
     @property
     def tags(self) -> List[str]:
-        return loads_json(self.tags_json) or []
+        return _stored_list(self.tags_json)
 
     @property
     def evidence_refs(self) -> Any:
-        return loads_json(self.evidence_refs_json) or []
+        return _stored_list(self.evidence_refs_json)
 
 
-@dataclass(frozen=True)
-class AttributionAssessment:
+class AttributionAssessment(NamedTuple):
     id: int
     case_id: str
     snapshot_id: str
@@ -84,7 +286,7 @@ class AttributionAssessment:
 
     @property
     def evidence_refs(self) -> Any:
-        return loads_json(self.evidence_refs_json) or []
+        return _stored_list(self.evidence_refs_json)
 
 
 class BlackboxDAO:
@@ -95,9 +297,15 @@ class BlackboxDAO:
 
     def __init__(self, db_path: str = "cases.db"):
         self.db_path = db_path
+        # SQLite connections must not be shared across threads, so each
+        # thread lazily opens (and then reuses) its own handle.
+        self._local = threading.local()
         self._ensure_db_dir()
         self._init_schema()
 
+    def __del__(self):
+        self.close()
+
     def _ensure_db_dir(self):
         # If someone passes a nested db path, ensure directory exists.
         d = os.path.dirname(os.path.abspath(self.db_path))
@@ -107,11 +315,80 @@ class BlackboxDAO:
     def _connect(self) -> sqlite3.Connection:
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+
+        # Per-connection settings (journal_mode is persisted in the file
+        # and set once in _init_schema).
         conn.execute("PRAGMA foreign_keys = ON;")
+        conn.execute("PRAGMA busy_timeout = 5000;")
+        conn.execute("PRAGMA synchronous = NORMAL;")
+        conn.execute("PRAGMA temp_store = MEMORY;")
+        conn.execute("PRAGMA cache_size = -65536;")
+        conn.execute("PRAGMA mmap_size = 268435456;")
+        return conn
+
+    def _conn(self) -> sqlite3.Connection:
+        """
+        Cached per-thread connection (opened on first use).
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
         return conn
 
+    def close(self):
+        """
+        Close the calling thread's cached connection, if any.
+        """
+        local = getattr(self, "_local", None)
+        conn = getattr(local, "conn", None)
+        if conn is not None:
+            conn.close()
+            local.conn = None
+
+    @contextmanager
+    def _transaction(self):
+        """
+        One write transaction per mutation: the row change and its audit
+        entry commit (or roll back) together. IMMEDIATE takes the write
+        lock up front, so AUTOINCREMENT ids handed out inside are
+        contiguous and the transaction never fails mid-way on a
+        read-to-write lock upgrade.
+        """
+        conn = self._conn()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+
+    def _select(self, sql: str, params: Sequence[Any]) -> sqlite3.Cursor:
+        """
+        Execute a read returning plain tuples (no sqlite3.Row wrapping).
+        """
+        cur = self._conn().cursor()
+        cur.row_factory = None
+        return cur.execute(sql, params)
+
     def _init_schema(self):
-        with self._connect() as conn:
+        memory = self.db_path == ":memory:"
+        key = os.path.abspath(self.db_path)
+        if not memory and key in _SCHEMA_INITIALIZED:
+            return
+
+        conn = self._conn()
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        if version < _SCHEMA_VERSION:
+            self._create_schema(conn, memory)
+
+        if not memory:
+            _SCHEMA_INITIALIZED.add(key)
+
+    def _create_schema(self, conn: sqlite3.Connection, memory: bool):
+        # WAL: concurrent readers during writes, far fewer fsyncs on the
+        # audit/journal insert path. Not applicable to in-memory databases.
+        if not memory:
+            conn.execute("PRAGMA journal_mode = WAL;")
+
+        with conn:
             conn.executescript(
                 """
                 CREATE TABLE IF NOT EXISTS work_orders (
@@ -130,8 +407,10 @@ class BlackboxDAO:
                     updated_at INTEGER NOT NULL
                 );
 
-                CREATE INDEX IF NOT EXISTS idx_work_orders_case_snapshot
-                ON work_orders(case_id, snapshot_id);
+                -- Matches list_work_orders' filter + ORDER BY, so no sort step.
+                DROP INDEX IF EXISTS idx_work_orders_case_snapshot;
+                CREATE INDEX IF NOT EXISTS idx_work_orders_case_snapshot_updated
+                ON work_orders(case_id, snapshot_id, updated_at DESC, id DESC);
 
                 CREATE TABLE IF NOT EXISTS blackbox_entries (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -173,46 +452,40 @@ class BlackboxDAO:
                     created_at INTEGER NOT NULL
                 );
 
-                CREATE INDEX IF NOT EXISTS idx_audit_case_snapshot
-                ON audit_log(case_id, snapshot_id);
+                -- Serves list_audit's filter + ORDER BY id DESC + LIMIT
+                -- and created_at range filters for reports.
+                DROP INDEX IF EXISTS idx_audit_case_snapshot;
+                DROP INDEX IF EXISTS idx_audit_case_snapshot_id;
+                CREATE INDEX IF NOT EXISTS idx_audit_case_snapshot_id_created
+                ON audit_log(case_id, snapshot_id, id DESC, created_at);
                 """
             )
+            conn.execute("ANALYZE;")
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION};")
 
     # -----------------------
     # Audit
     # -----------------------
-    def _audit(self, conn: sqlite3.Connection, case_id: str, snapshot_id: str, actor: str, action: str, details: Dict[str, Any]):
+    def _audit(self, conn: sqlite3.Connection, case_id: str, snapshot_id: str, actor: str, action: str, details: Dict[str, Any], now: int):
+        # `now` is the caller's timestamp, so a mutation and its audit row
+        # share one clock read.
         conn.execute(
-            """
-            INSERT INTO audit_log(case_id, snapshot_id, actor, action, details_json, created_at)
-            VALUES(?, ?, ?, ?, ?, ?)
-            """,
-            (case_id, snapshot_id, actor, action, dumps_json(details), int(time.time())),
+            _SQL_INSERT_AUDIT,
+            (case_id, snapshot_id, actor, action, dumps_json_fast(details) if details else _EMPTY_DETAILS, now),
         )
 
     def list_audit(self, case_id: str, snapshot_id: str, limit: int = 100) -> List[Dict[str, Any]]:
-        with self._connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT * FROM audit_log
-                WHERE case_id = ? AND snapshot_id = ?
-                ORDER BY id DESC
-                LIMIT ?
-                """,
-                (case_id, snapshot_id, int(limit)),
-            ).fetchall()
-            out = []
-            for r in rows:
-                out.append(
-                    {
-                        "id": r["id"],
-                        "actor": r["actor"],
-                        "action": r["action"],
-                        "details": loads_json(r["details_json"]),
-                        "created_at": r["created_at"],
-                    }
-                )
-            return out
+        cur = self._select(_SQL_LIST_AUDIT, (case_id, snapshot_id, int(limit)))
+        return [
+            {
+                "id": audit_id,
+                "actor": actor,
+                "action": action,
+                "details": loads_json(details_json),
+                "created_at": created_at,
+            }
+            for audit_id, actor, action, details_json, created_at in _iter_rows(cur)
+        ]
 
     # -----------------------
     # Work Orders
@@ -233,50 +506,45 @@ class BlackboxDAO:
         actor: str = "analyst",
     ) -> int:
         now = int(time.time())
-        evidence_refs = evidence_refs or []
-        with self._connect() as conn:
+        refs_json = dumps_json_safe(evidence_refs or [])
+        with self._transaction() as conn:
             cur = conn.execute(
-                """
-                INSERT INTO work_orders(
-                    case_id, snapshot_id, title, description, category,
-                    priority, status, owner, due_at, evidence_refs_json,
-                    created_at, updated_at
-                )
-                VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_WO,
                 (
                     case_id, snapshot_id, title, description, category,
-                    priority, status, owner, due_at, dumps_json(evidence_refs),
+                    priority, status, owner, due_at, refs_json,
                     now, now
                 ),
             )
             wo_id = int(cur.lastrowid)
-            self._audit(conn, case_id, snapshot_id, actor, "work_order_created", {"work_order_id": wo_id, "title": title})
+            self._audit(conn, case_id, snapshot_id, actor, "work_order_created", {"work_order_id": wo_id, "title": title}, now)
             return wo_id
 
     def list_work_orders(self, case_id: str, snapshot_id: str) -> List[WorkOrder]:
-        with self._connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT * FROM work_orders
-                WHERE case_id = ? AND snapshot_id = ?
-                ORDER BY updated_at DESC, id DESC
-                """,
-                (case_id, snapshot_id),
-            ).fetchall()
-            return [WorkOrder(**dict(r)) for r in rows]
+        cur = self._select(_SQL_LIST_WO, (case_id, snapshot_id))
+        return [WorkOrder._make(r) for r in _iter_rows(cur)]
 
     def update_work_order_status(self, work_order_id: int, status: str, actor: str = "analyst"):
         status = status.upper().strip()
-        with self._connect() as conn:
-            row = conn.execute("SELECT case_id, snapshot_id, status FROM work_orders WHERE id = ?", (int(work_order_id),)).fetchone()
+        work_order_id = int(work_order_id)
+        now = int(time.time())
+        with self._transaction() as conn:
+            if _HAS_JSON:
+                # Audit first: inserts nothing (rowcount 0) if the work
+                # order doesn't exist, so no separate SELECT is needed.
+                cur = conn.execute(_SQL_AUDIT_WO_STATUS, (actor, status, now, work_order_id))
+                if cur.rowcount:
+                    conn.execute(_SQL_UPDATE_WO_STATUS, (status, now, work_order_id))
+                return
+
+            row = conn.execute(_SQL_GET_WO_STATUS, (work_order_id,)).fetchone()
             if not row:
                 return
             conn.execute(
-                "UPDATE work_orders SET status = ?, updated_at = ? WHERE id = ?",
-                (status, int(time.time()), int(work_order_id)),
+                _SQL_UPDATE_WO_STATUS,
+                (status, now, work_order_id),
             )
-            self._audit(conn, row["case_id"], row["snapshot_id"], actor, "work_order_status_updated", {"work_order_id": work_order_id, "from": row["status"], "to": status})
+            self._audit(conn, row["case_id"], row["snapshot_id"], actor, "work_order_status_updated", {"work_order_id": work_order_id, "from": row["status"], "to": status}, now)
 
     # -----------------------
     # Blackbox Journal (append-only)
@@ -293,40 +561,64 @@ class BlackboxDAO:
         evidence_refs: Optional[Any] = None,
         created_by: str = "analyst",
     ) -> int:
-        tags = tags or []
-        evidence_refs = evidence_refs or []
+        return self.append_entries_bulk(
+            [
+                {
+                    "case_id": case_id,
+                    "snapshot_id": snapshot_id,
+                    "entry_type": entry_type,
+                    "title": title,
+                    "body": body,
+                    "tags": tags,
+                    "evidence_refs": evidence_refs,
+                    "created_by": created_by,
+                }
+            ]
+        )[0]
+
+    def append_entries_bulk(self, rows: Sequence[Dict[str, Any]]) -> List[int]:
+        """
+        Append many journal entries in one transaction.
+
+        Each row takes the same keys as append_entry(). Returns the new
+        entry ids in input order.
+        """
+        if not rows:
+            return []
+
         now = int(time.time())
-        with self._connect() as conn:
-            cur = conn.execute(
-                """
-                INSERT INTO blackbox_entries(
-                    case_id, snapshot_id, entry_type, title, body,
-                    tags_json, evidence_refs_json, created_by, created_at
-                )
-                VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+        entries = []
+        for r in rows:
+            tags_json = dumps_json_safe(r.get("tags") or [])
+            refs_json = dumps_json_safe(r.get("evidence_refs") or [])
+            entries.append(
                 (
-                    case_id, snapshot_id, entry_type, title, body,
-                    dumps_json(tags), dumps_json(evidence_refs),
-                    created_by, now
-                ),
+                    r["case_id"], r["snapshot_id"], r["entry_type"], r["title"], r["body"],
+                    tags_json, refs_json, r.get("created_by", "analyst"), now
+                )
             )
-            entry_id = int(cur.lastrowid)
-            self._audit(conn, case_id, snapshot_id, created_by, "blackbox_entry_appended", {"entry_id": entry_id, "type": entry_type, "title": title})
-            return entry_id
+
+        with self._transaction() as conn:
+            conn.executemany(_SQL_INSERT_ENTRY, entries)
+            last_id = int(conn.execute("SELECT last_insert_rowid()").fetchone()[0])
+            entry_ids = list(range(last_id - len(entries) + 1, last_id + 1))
+
+            conn.executemany(
+                _SQL_INSERT_AUDIT,
+                [
+                    (
+                        e[0], e[1], e[7], "blackbox_entry_appended",
+                        dumps_json_fast({"entry_id": entry_id, "type": e[2], "title": e[3]}),
+                        now,
+                    )
+                    for entry_id, e in zip(entry_ids, entries)
+                ],
+            )
+        return entry_ids
 
     def list_entries(self, case_id: str, snapshot_id: str, limit: int = 200) -> List[BlackboxEntry]:
-        with self._connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT * FROM blackbox_entries
-                WHERE case_id = ? AND snapshot_id = ?
-                ORDER BY id DESC
-                LIMIT ?
-                """,
-                (case_id, snapshot_id, int(limit)),
-            ).fetchall()
-            return [BlackboxEntry(**dict(r)) for r in rows]
+        cur = self._select(_SQL_LIST_ENTRIES, (case_id, snapshot_id, int(limit)))
+        return [BlackboxEntry._make(r) for r in _iter_rows(cur)]
 
     # -----------------------
     # Attribution
@@ -343,38 +635,20 @@ class BlackboxDAO:
         analyst_override: bool = False,
         updated_by: str = "analyst",
     ):
-        evidence_refs = evidence_refs or []
+        refs_json = dumps_json_safe(evidence_refs or [])
         now = int(time.time())
-        with self._connect() as conn:
+        with self._transaction() as conn:
             conn.execute(
-                """
-                INSERT INTO attribution_assessments(
-                    case_id, snapshot_id, origin, confidence, rationale,
-                    evidence_refs_json, analyst_override, updated_by, updated_at
-                )
-                VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(case_id, snapshot_id) DO UPDATE SET
-                    origin = excluded.origin,
-                    confidence = excluded.confidence,
-                    rationale = excluded.rationale,
-                    evidence_refs_json = excluded.evidence_refs_json,
-                    analyst_override = excluded.analyst_override,
-                    updated_by = excluded.updated_by,
-                    updated_at = excluded.updated_at
-                """,
+                _SQL_UPSERT_ATTR,
                 (
                     case_id, snapshot_id, origin, confidence, rationale,
-                    dumps_json(evidence_refs), 1 if analyst_override else 0,
+                    refs_json, 1 if analyst_override else 0,
                     updated_by, now
                 ),
             )
-            self._audit(conn, case_id, snapshot_id, updated_by, "attribution_upserted", {"origin": origin, "confidence": confidence, "override": bool(analyst_override)})
+            self._audit(conn, case_id, snapshot_id, updated_by, "attribution_upserted", {"origin": origin, "confidence": confidence, "override": bool(analyst_override)}, now)
 
     def get_attribution(self, case_id: str, snapshot_id: str) -> Optional[AttributionAssessment]:
-        with self._connect() as conn:
-            row = conn.execute(
-                "SELECT * FROM attribution_assessments WHERE case_id = ? AND snapshot_id = ?",
-                (case_id, snapshot_id),
-            ).fetchone()
-            return AttributionAssessment(**dict(row)) if row else None
+        row = self._select(_SQL_GET_ATTR, (case_id, snapshot_id)).fetchone()
+        return AttributionAssessment._make(row) if row else None
 
@@ -1,6 +1,8 @@
+import sqlite3
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+from . import db
 from .db import get_connection, init_db
 from .models import Case
 
@@ -9,27 +11,74 @@ from .models import Case
 # Input Validation Boundary
 # --------------------------------------------------
 
-def _validate_text(value: str, max_len: int = 255) -> str:
+# Per-field length limits for case columns.
+_MAXLEN = {
+    "snapshot_id": 128,
+    "title": 255,
+    "severity": 20,
+    "status": 20,
+    "tags": 255,
+    "notes": 2000,
+}
+
+
+def _validate_fields(fields: Dict[str, Optional[str]]) -> Dict[str, str]:
     """
     Defensive validation for all user-controlled text.
 
+    Walks every field once (limits from _MAXLEN); None becomes "".
+
     Protects against:
     - UI bugs
     - AI hallucinations
     - Accidental DB abuse
     """
-    if value is None:
-        return ""
+    maxlen = _MAXLEN
+    error = ValueError
+    out = {}
+
+    for name, value in fields.items():
+        if value is None:
+            out[name] = ""
+            continue
+
+        if not isinstance(value, str):
+            raise error("Invalid input type")
+
+        value = value.strip()
+
+        limit = maxlen[name]
+        if len(value) > limit:
+            raise error(f"Input exceeds {limit} characters")
 
-    if not isinstance(value, str):
-        raise ValueError("Invalid input type")
+        out[name] = value
 
-    value = value.strip()
+    return out
 
-    if len(value) > max_len:
-        raise ValueError(f"Input exceeds {max_len} characters")
 
-    return value
+# --------------------------------------------------
+# SQL
+# --------------------------------------------------
+
+# Fixed statement text, so sqlite3's per-connection statement cache
+# can reuse the prepared statement across calls.
+_SQL_INSERT_CASE = """
+    INSERT OR REPLACE INTO cases (
+        id,
+        title,
+        severity,
+        status,
+        tags,
+        notes,
+        event_count,
+        detection_count,
+        created_at,
+        updated_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_LIST_CASES = "SELECT * FROM cases ORDER BY created_at DESC"
 
 
 # --------------------------------------------------
@@ -37,8 +86,8 @@ def _validate_text(value: str, max_len: int = 255) -> str:
 # --------------------------------------------------
 
 class CaseDAO:
-    def __init__(self):
-        init_db()
+    # Schema is ensured lazily by the write paths (memoized in init_db),
+    # so read-only commands never run DDL.
 
     def create_case(
         self,
@@ -51,41 +100,32 @@ class CaseDAO:
         event_count: Optional[int] = None,
         detection_count: Optional[int] = None,
     ):
+        init_db()
         now = datetime.utcnow().isoformat()
 
-        snapshot_id = _validate_text(snapshot_id, 128)
-        title = _validate_text(title, 255)
-        severity = _validate_text(severity, 20)
-        status = _validate_text(status, 20)
-        tags = _validate_text(tags, 255)
-        notes = _validate_text(notes, 2000)
+        v = _validate_fields(
+            {
+                "snapshot_id": snapshot_id,
+                "title": title,
+                "severity": severity,
+                "status": status,
+                "tags": tags,
+                "notes": notes,
+            }
+        )
 
         conn = get_connection()
         cur = conn.cursor()
 
         cur.execute(
-            """
-            INSERT OR REPLACE INTO cases (
-                id,
-                title,
-                severity,
-                status,
-                tags,
-                notes,
-                event_count,
-                detection_count,
-                created_at,
-                updated_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            _SQL_INSERT_CASE,
             (
-                snapshot_id,
-                title,
-                severity,
-                status,
-                tags,
-                notes,
+                v["snapshot_id"],
+                v["title"],
+                v["severity"],
+                v["status"],
+                v["tags"],
+                v["notes"],
                 event_count,
                 detection_count,
                 now,
@@ -94,17 +134,23 @@ class CaseDAO:
         )
 
         conn.commit()
-        conn.close()
 
     def list_cases(self) -> List[Case]:
-        conn = get_connection()
-        cur = conn.cursor()
+        # Looked up at call time, like get_connection() does, so a
+        # patched db.DB_PATH is honoured by both.
+        if not db.DB_PATH.exists():
+            return []
 
-        rows = cur.execute(
-            "SELECT * FROM cases ORDER BY created_at DESC"
-        ).fetchall()
+        conn = get_connection(read_only=True)
+        cur = conn.cursor()
 
-        conn.close()
+        try:
+            rows = cur.execute(_SQL_LIST_CASES).fetchall()
+        except sqlite3.OperationalError as err:
+            # Database exists but no case was ever registered.
+            if "no such table" in str(err):
+                return []
+            raise
 
         return [Case(**dict(row)) for row in rows]
 
@@ -117,38 +163,29 @@ class CaseDAO:
         tags: Optional[str] = None,
         notes: Optional[str] = None,
     ):
-        fields = []
-        values = []
-
-        snapshot_id = _validate_text(snapshot_id, 128)
-
-        if title is not None:
-            fields.append("title = ?")
-            values.append(_validate_text(title, 255))
-
-        if severity is not None:
-            fields.append("severity = ?")
-            values.append(_validate_text(severity, 20))
-
-        if status is not None:
-            fields.append("status = ?")
-            values.append(_validate_text(status, 20))
-
-        if tags is not None:
-            fields.append("tags = ?")
-            values.append(_validate_text(tags, 255))
-
-        if notes is not None:
-            fields.append("notes = ?")
-            values.append(_validate_text(notes, 2000))
-
-        if not fields:
+        updates = {"snapshot_id": snapshot_id}
+        for name, value in (
+            ("title", title),
+            ("severity", severity),
+            ("status", status),
+            ("tags", tags),
+            ("notes", notes),
+        ):
+            if value is not None:
+                updates[name] = value
+
+        values = list(_validate_fields(updates).values())
+        snapshot_id = values.pop(0)
+
+        if not values:
             return
 
+        fields = [f"{name} = ?" for name in updates if name != "snapshot_id"]
         fields.append("updated_at = ?")
         values.append(datetime.utcnow().isoformat())
         values.append(snapshot_id)
 
+        init_db()
         conn = get_connection()
         cur = conn.cursor()
 
@@ -162,5 +199,4 @@ class CaseDAO:
         )
 
         conn.commit()
-        conn.close()
 
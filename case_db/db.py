@@ -1,10 +1,65 @@
 import sqlite3
+import threading
 from pathlib import Path
+from urllib.parse import quote
 
 DB_PATH = Path("cases.db")
 
+# Database paths whose schema this process has already ensured.
+_SCHEMA_INITIALIZED = set()
 
-def get_connection():
+# One pooled connection per thread (sqlite3 connections are not shared
+# across threads), tagged with the DB_PATH it was opened for.
+_local = threading.local()
+
+
+def get_connection(read_only: bool = False):
+    """
+    Shared hardened SQLite connection for the calling thread.
+
+    Opened (and PRAGMA-configured) on first use, then reused while
+    DB_PATH is unchanged; callers must not close it. Use
+    close_connection() to release it.
+
+    read_only=True returns a separate mode=ro connection for viewers: no
+    schema work, no write locks, no WAL checkpoints.
+    """
+    attr = "ro_conn" if read_only else "conn"
+    pooled = getattr(_local, attr, None)
+    if pooled is not None:
+        conn, path = pooled
+        if path == DB_PATH:
+            return conn
+        # DB_PATH was repointed (e.g. by tests): drop the old handle.
+        conn.close()
+
+    conn = _open_read_only() if read_only else _open_connection()
+    setattr(_local, attr, (conn, DB_PATH))
+    return conn
+
+
+def close_connection():
+    """
+    Close the calling thread's pooled connections, if any.
+    """
+    for attr in ("conn", "ro_conn"):
+        pooled = getattr(_local, attr, None)
+        if pooled is not None:
+            pooled[0].close()
+            setattr(_local, attr, None)
+
+
+def _open_read_only():
+    """
+    Open the case database read-only (fails if it does not exist yet).
+    """
+    uri = f"file:{quote(str(DB_PATH.resolve()))}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _open_connection():
     """
     Create a hardened SQLite connection.
     """
@@ -28,10 +83,26 @@ def get_connection():
 def init_db():
     """
     Initialise case database schema (idempotent).
+
+    Cheap on repeat calls: memoized per process, and the DDL only runs
+    when the cases table is actually missing.
     """
+    key = str(DB_PATH.resolve())
+    if key in _SCHEMA_INITIALIZED:
+        return
+
     conn = get_connection()
     cur = conn.cursor()
 
+    # PRAGMA user_version is left to the blackbox schema, which shares
+    # this file; a sqlite_master probe is an equally cheap O(1) read.
+    exists = cur.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'cases'"
+    ).fetchone()
+    if exists:
+        _SCHEMA_INITIALIZED.add(key)
+        return
+
     cur.execute(
         """
         CREATE TABLE IF NOT EXISTS cases (
@@ -50,5 +121,5 @@ def init_db():
     )
 
     conn.commit()
-    conn.close()
+    _SCHEMA_INITIALIZED.add(key)
 
@@ -1,11 +1,11 @@
 # cli/commands.py
+import codecs
 import json
 import os
 import time
 
 from core.replay_source import JsonReplaySource, TTFRReplaySource
-from core.entities import EntityExtractor
-from core.mitre import MitreMapper
+from core.pipeline import analyze
 from core.bookmarks import BookmarkStore
 from core.detections import (
     RetroDetectionEngine,
@@ -17,6 +17,26 @@ from reports.forensic_report import ForensicReportBuilder
 from reports.executive_summary import ExecutiveSummaryBuilder
 from ttfr.engine import TTFREngine
 from case_db import CaseDAO
+from cli.watch import FileWatcher
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+# Both parsers accept bytes directly, so JSONL is read in binary mode and
+# never decoded to str first.
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _skip_bom(f) -> None:
+    """
+    Consume a leading UTF-8 BOM: orjson rejects it, stdlib json on bytes
+    tolerates it. Per-line whitespace (including \r\n) is accepted by
+    both parsers, so lines are otherwise passed through unstripped.
+    """
+    if f.peek(3)[:3] == codecs.BOM_UTF8:
+        f.read(3)
 
 
 # ==================================================
@@ -25,14 +45,15 @@ from case_db import CaseDAO
 
 def run_ingest(input_path: str, snapshot_id: str):
     ttfr = TTFREngine()
+    record = ttfr.record
 
-    with open(input_path, "r") as f:
+    with open(input_path, "rb", buffering=1 << 20) as f:
+        _skip_bom(f)
         for line in f:
-            line = line.strip()
-            if not line:
+            if line.isspace():
                 continue
-            e = json.loads(line)
-            ttfr.record(
+            e = _loads(line)
+            record(
                 timestamp=e["timestamp"],
                 event_type=e["type"],
                 payload=e.get("payload", {}),
@@ -49,6 +70,7 @@ def run_ingest(input_path: str, snapshot_id: str):
 
 def run_stream(input_path: str, snapshot_id: str, sleep_seconds: float, checkpoint_every: int):
     ttfr = TTFREngine()
+    record = ttfr.record
     checkpoint_every = int(checkpoint_every) if checkpoint_every and checkpoint_every > 0 else 200
     sleep_seconds = float(sleep_seconds) if sleep_seconds and sleep_seconds > 0 else 0.0
 
@@ -56,46 +78,57 @@ def run_stream(input_path: str, snapshot_id: str, sleep_seconds: float, checkpoi
     print(f"[STREAM] Following file: {input_path}")
     print(f"[STREAM] checkpoint_every={checkpoint_every} • sleep={sleep_seconds}s")
 
+    # Wakes on filesystem events (inotify/kqueue) instead of fixed-interval
+    # polling; degrades to sleeping when neither is available.
+    watcher = FileWatcher(input_path, poll_interval=max(0.05, sleep_seconds))
+
     # Wait until file exists (common in live pipelines)
-    while not os.path.exists(input_path):
-        time.sleep(0.25)
+    watcher.wait_exists()
 
     event_count = 0
 
-    with open(input_path, "r") as f:
+    with open(input_path, "rb", buffering=0) as f:
         # Start at end if you want "only new"
         # Comment out next line if you want replay from beginning.
         f.seek(0, os.SEEK_END)
 
+        # Bytes after the last newline: a line the writer hasn't finished.
+        pending = b""
+
         try:
             while True:
-                line = f.readline()
-                if not line:
-                    # No new data yet
-                    time.sleep(max(0.05, sleep_seconds))
+                chunk = f.read(1 << 16)
+                if not chunk:
+                    # Drained to EOF; block until the writer appends
+                    watcher.wait()
                     continue
 
-                line = line.strip()
-                if not line:
-                    continue
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
 
-                e = json.loads(line)
-                ttfr.record(
-                    timestamp=e["timestamp"],
-                    event_type=e["type"],
-                    payload=e.get("payload", {}),
-                )
-                event_count += 1
+                for line in lines:
+                    if not line or line.isspace():
+                        continue
 
-                if event_count % checkpoint_every == 0:
-                    ttfr.save_snapshot(snapshot_id)
-                    print(f"[STREAM] Checkpoint at event {event_count}")
+                    e = _loads(line)
+                    record(
+                        timestamp=e["timestamp"],
+                        event_type=e["type"],
+                        payload=e.get("payload", {}),
+                    )
+                    event_count += 1
 
-                if sleep_seconds > 0:
-                    time.sleep(sleep_seconds)
+                    if event_count % checkpoint_every == 0:
+                        ttfr.save_snapshot(snapshot_id)
+                        print(f"[STREAM] Checkpoint at event {event_count}")
+
+                    if sleep_seconds > 0:
+                        time.sleep(sleep_seconds)
 
         except KeyboardInterrupt:
             pass
+        finally:
+            watcher.close()
 
     path = ttfr.save_snapshot(snapshot_id)
     print(f"[STREAM] Final snapshot saved to {path}")
@@ -124,11 +157,7 @@ def common_analysis(source: str, input_path: str | None, snapshot_id: str | None
     replay = load_replay(source, input_path, snapshot_id)
     events = replay.replay()
 
-    extractor = EntityExtractor()
-    extractor.extract(events)
-
-    mapper = MitreMapper()
-    mitre = mapper.map_timeline(events)
+    extractor, mitre, _, _ = analyze(events)
 
     bookmarks = BookmarkStore()
     if events:
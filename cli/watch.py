@@ -0,0 +1,105 @@
+# cli/watch.py
+"""
+File-change notification for live (tail-follow) ingest.
+
+Backends, best first:
+- inotify via the optional `inotify_simple` package (Linux)
+- kqueue from the stdlib `select` module (macOS / BSD)
+- plain sleep polling (everywhere else)
+
+Wake-ups may be spurious (e.g. another file in the same directory
+changed); callers simply drain the file again and go back to waiting.
+"""
+import os
+import select
+import time
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:  # optional; falls back to kqueue / polling
+    INotify = None
+
+
+class FileWatcher:
+    def __init__(self, path: str, poll_interval: float = 0.05):
+        self.path = os.path.abspath(path)
+        self.poll_interval = poll_interval
+
+        if INotify is not None:
+            self._backend = _InotifyBackend(self.path)
+        elif hasattr(select, "kqueue"):
+            self._backend = _KqueueBackend(self.path)
+        else:
+            self._backend = None
+
+    def wait_exists(self, timeout: float = 1.0) -> None:
+        """
+        Block until the watched file exists.
+        """
+        while not os.path.exists(self.path):
+            self.wait(timeout)
+
+    def wait(self, timeout: float = 1.0) -> None:
+        """
+        Block until the file (or its directory) changes, or timeout.
+        """
+        if self._backend is None:
+            time.sleep(self.poll_interval)
+        else:
+            self._backend.wait(timeout)
+
+    def close(self) -> None:
+        if self._backend is not None:
+            self._backend.close()
+            self._backend = None
+
+
+class _InotifyBackend:
+    def __init__(self, path: str):
+        self._inotify = INotify()
+        # Watching the directory covers both "file created" and "file
+        # appended to", and survives the file being replaced.
+        self._inotify.add_watch(
+            os.path.dirname(path),
+            inotify_flags.CREATE | inotify_flags.MODIFY | inotify_flags.MOVED_TO,
+        )
+
+    def wait(self, timeout: float) -> None:
+        self._inotify.read(timeout=int(timeout * 1000))
+
+    def close(self) -> None:
+        self._inotify.close()
+
+
+class _KqueueBackend:
+    def __init__(self, path: str):
+        self._path = path
+        self._kq = select.kqueue()
+        self._fd = None
+        self._watching_file = False
+
+    def _arm(self):
+        # Watch the directory until the file appears, then the file itself.
+        exists = os.path.exists(self._path)
+        if self._fd is None or (exists and not self._watching_file):
+            if self._fd is not None:
+                os.close(self._fd)
+            target = self._path if exists else os.path.dirname(self._path)
+            self._fd = os.open(target, os.O_RDONLY)
+            self._watching_file = exists
+
+        return select.kevent(
+            self._fd,
+            filter=select.KQ_FILTER_VNODE,
+            flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+            fflags=select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND,
+        )
+
+    def wait(self, timeout: float) -> None:
+        self._kq.control([self._arm()], 1, timeout)
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self._kq.close()
@@ -1,9 +1,12 @@
+import ast
+import textwrap
 from dataclasses import dataclass
-from typing import List
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 from .event import ForensicEvent
+from .matchers import POWERSHELL_IMAGE
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DetectionHit:
     """
     A detection hit bound to a forensic event.
@@ -15,6 +18,85 @@ class DetectionHit:
     evidence: str
 
 
+class _EscapeFinder(ast.NodeVisitor):
+    """
+    Finds statements that would leave an inline_source block: once the
+    block is pasted into the compiled loop, `return` ends the whole run
+    and `break`/`continue` skip the rules and events after it.
+    """
+
+    def __init__(self):
+        self.loops = 0
+        self.found: Optional[str] = None
+
+    def generic_visit(self, node):
+        if self.found is None:
+            super().generic_visit(node)
+
+    def visit_FunctionDef(self, node):
+        pass  # own scope: its returns stay inside it
+
+    visit_AsyncFunctionDef = visit_Lambda = visit_ClassDef = visit_FunctionDef
+
+    def _visit_loop(self, node):
+        self.loops += 1
+        for child in node.body:
+            self.visit(child)
+        self.loops -= 1
+        for child in node.orelse:
+            self.visit(child)
+
+    visit_For = visit_AsyncFor = visit_While = _visit_loop
+
+    def visit_Return(self, node):
+        self.found = "return"
+
+    def visit_Yield(self, node):
+        self.found = "yield"
+
+    visit_YieldFrom = visit_Yield
+
+    def visit_Break(self, node):
+        if not self.loops:
+            self.found = "break"
+
+    def visit_Continue(self, node):
+        if not self.loops:
+            self.found = "continue"
+
+
+def _inline_block(source: str) -> str:
+    """
+    Dedented inline_source block, rejected if it could escape the block.
+    """
+    block = textwrap.dedent(source).strip()
+    finder = _EscapeFinder()
+    finder.visit(ast.parse(block))
+    if finder.found is not None:
+        raise ValueError(
+            f"inline_source must not use '{finder.found}' outside its own "
+            "functions/loops; guard the append() call with if instead"
+        )
+    return block
+
+
+def _inline_function(source: str) -> Callable:
+    """
+    Compile an inline_source block into _inline(rule, e, p, append).
+    """
+    body = textwrap.indent(_inline_block(source), " " * 4)
+    ns = dict(globals())
+    exec(compile(f"def _inline(rule, e, p, append):\n{body}", "<inline rule>", "exec"), ns)
+    return ns["_inline"]
+
+
+def _defining_class(cls: type, name: str) -> Optional[type]:
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass
+    return None
+
+
 class DetectionRule:
     """
     Base class for retroactive detection rules.
@@ -23,9 +105,47 @@ class DetectionRule:
     rule_id: str = "RULE-BASE"
     description: str = "Base detection rule"
 
+    # Event types the rule can fire on; empty means every event type.
+    applies_to: Tuple[str, ...] = ()
+
+    # Optional statement block holding the rule's logic for events of the
+    # applies_to types. It sees `e`, `p` (payload), `rule` (this rule)
+    # and `append` (adds a DetectionHit), plus this module's globals.
+    # A class that sets it without defining evaluate() gets evaluate()
+    # generated from it, and RetroDetectionEngine inlines it into its
+    # compiled loop; the block is the single copy of the logic. Since it
+    # is pasted into that loop, it must fall through to its end: return,
+    # yield, and break/continue outside its own loops raise ValueError.
+    inline_source: Optional[str] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get("inline_source") and "evaluate" not in cls.__dict__:
+            inline = _inline_function(cls.inline_source)
+
+            def evaluate(self, event: ForensicEvent) -> List[DetectionHit]:
+                if self.applies_to and event.event_type not in self.applies_to:
+                    return []
+                hits: List[DetectionHit] = []
+                inline(self, event, event.payload, hits.append)
+                return hits
+
+            cls.evaluate = evaluate
+
     def evaluate(self, event: ForensicEvent) -> List[DetectionHit]:
         raise NotImplementedError
 
+    def inlinable(self) -> bool:
+        """
+        True when inline_source is the logic evaluate() runs, i.e. both
+        come from the same class (a subclass overriding only evaluate()
+        must not be inlined with its parent's block).
+        """
+        if not self.inline_source:
+            return False
+        cls = type(self)
+        return _defining_class(cls, "inline_source") is _defining_class(cls, "evaluate")
+
 
 # --------------------------------------------------
 # Example Detection Rules
@@ -34,47 +154,121 @@ class DetectionRule:
 class SuspiciousPowerShellRule(DetectionRule):
     rule_id = "DET-PS-001"
     description = "Suspicious PowerShell execution"
-
-    def evaluate(self, event: ForensicEvent) -> List[DetectionHit]:
-        if event.event_type == "process_start":
-            image = event.payload.get("image", "").lower()
-            if "powershell" in image:
-                return [
-                    DetectionHit(
-                        rule_id=self.rule_id,
-                        description=self.description,
-                        event_seq=event.seq,
-                        timestamp=event.timestamp,
-                        evidence=f"Process image: {image}",
-                    )
-                ]
-        return []
+    applies_to = ("process_start",)
+    inline_source = """
+        image = p.get("image", "")
+        if POWERSHELL_IMAGE.search(image):
+            image = image.lower()
+            append(
+                DetectionHit(
+                    rule_id=rule.rule_id,
+                    description=rule.description,
+                    event_seq=e.seq,
+                    timestamp=e.timestamp,
+                    evidence=f"Process image: {image}",
+                )
+            )
+    """
 
 
 class SuspiciousC2ConnectionRule(DetectionRule):
     rule_id = "DET-C2-001"
     description = "Suspicious outbound network connection"
-
-    def evaluate(self, event: ForensicEvent) -> List[DetectionHit]:
-        if event.event_type == "network_connect":
-            port = int(event.payload.get("port", 0))
-            if port not in (80, 443):
-                return [
-                    DetectionHit(
-                        rule_id=self.rule_id,
-                        description=self.description,
-                        event_seq=event.seq,
-                        timestamp=event.timestamp,
-                        evidence=f"Outbound connection on port {port}",
-                    )
-                ]
-        return []
+    applies_to = ("network_connect",)
+    inline_source = """
+        port = int(p.get("port", 0))
+        if port not in (80, 443):
+            append(
+                DetectionHit(
+                    rule_id=rule.rule_id,
+                    description=rule.description,
+                    event_seq=e.seq,
+                    timestamp=e.timestamp,
+                    evidence=f"Outbound connection on port {port}",
+                )
+            )
+    """
 
 
 # --------------------------------------------------
 # Detection Engine
 # --------------------------------------------------
 
+def index_rules(
+    rules: Sequence[DetectionRule],
+) -> Tuple[Dict[str, List[DetectionRule]], List[DetectionRule]]:
+    """
+    Index rules by the event types they declare.
+
+    Returns (by_type, wildcard): by_type[t] lists, in original order,
+    every rule that can fire on t (including wildcards); event types
+    nobody declared fall back to the wildcard rules alone.
+    """
+    wildcard = [r for r in rules if not r.applies_to]
+    types = dict.fromkeys(t for r in rules for t in r.applies_to)
+    by_type = {
+        t: [r for r in rules if not r.applies_to or t in r.applies_to]
+        for t in types
+    }
+    return by_type, wildcard
+
+
+def _compile_rules(
+    rules: Sequence[DetectionRule],
+) -> Callable[[Iterable[ForensicEvent], List[DetectionHit]], None]:
+    """
+    Generate one fused loop for a fixed rule list.
+
+    Dispatch on event_type becomes an if/elif chain, inlinable rules
+    (see DetectionRule.inlinable) are pasted into their branch, and the
+    rest are called through their bound evaluate(). Hit order matches
+    the indexed loop.
+    """
+    by_type, wildcard = index_rules(rules)
+    ns = dict(globals())
+    index = {id(rule): i for i, rule in enumerate(rules)}
+
+    def branch(branch_rules: List[DetectionRule], depth: int = 12) -> str:
+        lines = ["p = e.payload"]
+        for rule in branch_rules:
+            i = index[id(rule)]
+            ns[f"rule_{i}"] = rule
+            ns[f"evaluate_{i}"] = rule.evaluate
+            if rule.inlinable():
+                lines.append(f"rule = rule_{i}")
+                lines.append(_inline_block(rule.inline_source))
+            else:
+                lines.append(f"extend(evaluate_{i}(e))")
+        return textwrap.indent("\n".join(lines), " " * depth)
+
+    body = []
+    for n, (event_type, branch_rules) in enumerate(by_type.items()):
+        keyword = "if" if n == 0 else "elif"
+        body.append(f"        {keyword} et == {event_type!r}:")
+        body.append(branch(branch_rules))
+    if wildcard:
+        if body:
+            body.append("        else:")
+            body.append(branch(wildcard))
+        else:
+            body.append(branch(wildcard, depth=8))
+    if not body:
+        body.append("        pass")
+
+    source = "\n".join(
+        [
+            "def _run(events, hits):",
+            "    append = hits.append",
+            "    extend = hits.extend",
+            "    for e in events:",
+            "        et = e.event_type",
+            *body,
+        ]
+    )
+    exec(compile(source, "<detection rules>", "exec"), ns)
+    return ns["_run"]
+
+
 class RetroDetectionEngine:
     """
     Applies detection rules retroactively over replayed events.
@@ -82,13 +276,23 @@ class RetroDetectionEngine:
 
     def __init__(self, rules: List[DetectionRule]):
         self.rules = rules
+        self._compiled_for: Optional[Tuple[DetectionRule, ...]] = None
+        self._prepare()
+
+    def _prepare(self) -> None:
+        """
+        (Re)build the compiled loop if self.rules changed.
+        """
+        current = tuple(self.rules)
+        if current == self._compiled_for:
+            return
+        self._run = _compile_rules(current)
+        self._compiled_for = current
 
     def run(self, events: List[ForensicEvent]) -> List[DetectionHit]:
+        self._prepare()
         hits: List[DetectionHit] = []
 
-        for e in events:
-            for rule in self.rules:
-                hits.extend(rule.evaluate(e))
-
+        # Single generated loop: type dispatch and rule bodies inlined.
+        self._run(events, hits)
         return hits
-
@@ -30,17 +30,20 @@ class IncidentDiff:
 
     def diff(self) -> Dict[str, Dict[str, Set]]:
         return {
-            "processes": {
-                "added": self.processes_b - self.processes_a,
-                "removed": self.processes_a - self.processes_b,
-            },
-            "networks": {
-                "added": self.networks_b - self.networks_a,
-                "removed": self.networks_a - self.networks_b,
-            },
-            "files": {
-                "added": self.files_b - self.files_a,
-                "removed": self.files_a - self.files_b,
-            },
+            "processes": _added_removed(self.processes_a, self.processes_b),
+            "networks": _added_removed(self.networks_a, self.networks_b),
+            "files": _added_removed(self.files_a, self.files_b),
         }
 
+
+def _added_removed(a: Set, b: Set) -> Dict[str, Set]:
+    """
+    Split a ^ b into added/removed. Set-to-set operations reuse the
+    hashes the sets already store, and each intersection iterates the
+    smaller operand (usually the symmetric difference).
+    """
+    sym = a ^ b
+    return {
+        "added": sym & b,
+        "removed": sym & a,
+    }
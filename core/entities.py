@@ -11,22 +11,85 @@ from typing import Set, Dict, Any
 from .event import ForensicEvent
 
 
-@dataclass(frozen=True)
-class ProcessEntity:
+# Entities are set keys in extraction and diffing. Their hash is computed
+# once at construction (the generated __hash__ builds a field tuple on
+# every call) and equality short-circuits on identity / hash mismatch.
+# Pickling rebuilds via __init__: str hashes differ between processes.
+
+class _HashSlot:
+    # Storage for the cached hash. A plain slot rather than a dataclass
+    # field, so the per-process value stays out of fields() and asdict().
+    __slots__ = ("_h",)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ProcessEntity(_HashSlot):
     pid: int
     image: str
 
+    def __post_init__(self):
+        object.__setattr__(self, "_h", hash((self.pid, self.image)))
+
+    def __hash__(self):
+        return self._h
 
-@dataclass(frozen=True)
-class NetworkEntity:
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self is other or (
+            self._h == other._h
+            and self.pid == other.pid
+            and self.image == other.image
+        )
+
+    def __reduce__(self):
+        return (self.__class__, (self.pid, self.image))
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class NetworkEntity(_HashSlot):
     dst: str
     port: int
 
+    def __post_init__(self):
+        object.__setattr__(self, "_h", hash((self.dst, self.port)))
+
+    def __hash__(self):
+        return self._h
 
-@dataclass(frozen=True)
-class FileEntity:
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self is other or (
+            self._h == other._h
+            and self.dst == other.dst
+            and self.port == other.port
+        )
+
+    def __reduce__(self):
+        return (self.__class__, (self.dst, self.port))
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class FileEntity(_HashSlot):
     path: str
 
+    def __post_init__(self):
+        object.__setattr__(self, "_h", hash((self.path,)))
+
+    def __hash__(self):
+        return self._h
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self is other or (
+            self._h == other._h and self.path == other.path
+        )
+
+    def __reduce__(self):
+        return (self.__class__, (self.path,))
+
 
 class EntityExtractor:
     def __init__(self):
@@ -2,8 +2,15 @@ from dataclasses import dataclass
 from typing import Dict, Any
 
 
-@dataclass(frozen=True)
-class ForensicEvent:
+class _EncodedSlot:
+    # Storage for ForensicEvent's lazily encoded stable_repr(). A plain
+    # slot rather than a dataclass field, so it stays out of fields(),
+    # asdict(), repr and comparisons.
+    __slots__ = ("_encoded_cache",)
+
+
+@dataclass(frozen=True, slots=True)
+class ForensicEvent(_EncodedSlot):
     """
     Canonical forensic event.
     """
@@ -12,6 +19,17 @@ class ForensicEvent:
     event_type: str
     payload: Dict[str, Any]
 
+    @property
+    def _encoded(self) -> bytes:
+        # UTF-8 stable_repr(), computed on first use only: events are
+        # immutable and get re-hashed by every evidence hash / chain
+        # snapshot that covers them, but most runs never hash at all.
+        try:
+            return self._encoded_cache
+        except AttributeError:
+            encoded = self.stable_repr().encode("utf-8")
+            object.__setattr__(self, "_encoded_cache", encoded)
+            return encoded
+
     def stable_repr(self) -> str:
         return f"{self.seq}|{self.timestamp}|{self.event_type}|{self.payload}"
-
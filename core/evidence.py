@@ -1,14 +1,21 @@
-import hashlib
-from typing import List
+from typing import Iterable
 from .event import ForensicEvent
+from .hashing import HASH_NAME, format_digest, hasher
 
 
-def compute_evidence_hash(events: List[ForensicEvent]) -> str:
+def compute_evidence_hash(
+    events: Iterable[ForensicEvent], algorithm: str = HASH_NAME
+) -> str:
     """
     Deterministic evidence hash over a replay.
-    """
-    h = hashlib.sha256()
-    for e in events:
-        h.update(e.stable_repr().encode("utf-8"))
-    return h.hexdigest()
 
+    Records are joined with an ASCII record separator (0x1E) so distinct
+    event sequences can't produce the same byte stream, and the whole
+    blob is hashed in one call. For repeated hashes over a growing log,
+    use TTFR.evidence_hash() (an incremental Merkle root) instead.
+    Non-sha256 digests are tagged with their algorithm (format_digest).
+    """
+    digest = hasher(algorithm)(
+        b"\x1e".join([e._encoded for e in events])
+    ).digest()
+    return format_digest(algorithm, digest)
@@ -1,42 +1,108 @@
-import hashlib
+import hmac
+from operator import attrgetter, lt
 from typing import List, Optional
 from .event import ForensicEvent
+from .hashing import HASH_NAME, format_digest, hasher
+
+_seq_of = attrgetter("seq")
 
 
 class EvidenceChain:
     """
     Cryptographic chain of custody for forensic snapshots.
+
+    Snapshots are growing prefixes of one append-only event log. Each
+    snapshot contributes a leaf digest over only the events added since
+    the previous snapshot (each terminated by 0x1E), and is linked as
+    H(previous link || leaf), so hashing is O(delta) per snapshot. H is
+    pinned per chain (self.algorithm; TTFR_HASH picks the default), and
+    returned links are tagged with it (see hashing.format_digest).
+
+    A snapshot must extend what is already chained: at least as long,
+    with the last chained event unchanged at the same position, and new
+    events in increasing seq order. Anything else raises ValueError
+    rather than being silently hashed as "no new events".
     """
 
-    def __init__(self):
+    def __init__(self, algorithm: str = HASH_NAME):
+        self.algorithm = algorithm
+        self._new = hasher(algorithm)
         self._previous_hash: Optional[str] = None
         self._chain: List[str] = []
+        self._leaves: List[bytes] = []
+        self._prev_digest = b""
+        self._count = 0
+        self._last_event: Optional[ForensicEvent] = None
 
     def add_snapshot(self, events: List[ForensicEvent]) -> str:
-        h = hashlib.sha256()
+        count = self._count
+        if len(events) < count:
+            raise ValueError(
+                f"Snapshot has {len(events)} events; {count} are already chained"
+            )
+
+        last = self._last_event
+        if last is not None:
+            boundary = events[count - 1]
+            if boundary.seq != last.seq or boundary._encoded != last._encoded:
+                raise ValueError(
+                    "Snapshot does not extend the chained event log "
+                    f"(event {count - 1} differs)"
+                )
 
-        # Chain with previous snapshot
-        if self._previous_hash:
-            h.update(self._previous_hash.encode("utf-8"))
+        new = events[count:]
+        if new:
+            seqs = list(map(_seq_of, new))
+            if (last is not None and seqs[0] <= last.seq) or not all(
+                map(lt, seqs, seqs[1:])
+            ):
+                raise ValueError("Snapshot events are not in increasing seq order")
 
-        # Hash current snapshot deterministically
-        for e in events:
-            h.update(e.stable_repr().encode("utf-8"))
+            leaf = self._new(
+                b"\x1e".join([e._encoded for e in new]) + b"\x1e"
+            ).digest()
+            self._count = count + len(new)
+            self._last_event = new[-1]
+        else:
+            leaf = self._new(b"").digest()
 
-        snapshot_hash = h.hexdigest()
+        digest = self._new(self._prev_digest + leaf).digest()
+        snapshot_hash = format_digest(self.algorithm, digest)
+
+        self._leaves.append(leaf)
         self._chain.append(snapshot_hash)
+        self._prev_digest = digest
+        self._previous_hash = snapshot_hash
+
+        return snapshot_hash
+
+    def add_root(self, root: bytes) -> str:
+        """
+        Chain a precomputed snapshot commitment (e.g. a Merkle root from
+        TTFR) as the leaf, skipping the per-event hashing entirely.
+        """
+        digest = self._new(self._prev_digest + root).digest()
+        snapshot_hash = format_digest(self.algorithm, digest)
+
+        self._leaves.append(root)
+        self._chain.append(snapshot_hash)
+        self._prev_digest = digest
         self._previous_hash = snapshot_hash
 
         return snapshot_hash
 
     def verify(self) -> bool:
         """
-        Verify chain integrity.
+        Verify chain integrity by recomputing every link from its leaf.
         """
-        prev = None
-        for h in self._chain:
-            if prev and not h.startswith(prev[:8]):
+        if len(self._leaves) != len(self._chain):
+            return False
+
+        name = self.algorithm
+        new = hasher(name)
+        prev = b""
+        for leaf, expected in zip(self._leaves, self._chain):
+            prev = new(prev + leaf).digest()
+            if not hmac.compare_digest(format_digest(name, prev), expected):
                 return False
-            prev = h
         return True
-
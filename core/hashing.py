@@ -0,0 +1,81 @@
+"""
+Evidence hash algorithm selection.
+
+TTFR_HASH picks the algorithm for new Merkle trees and evidence chains:
+"sha256" (default), "blake2b" (BLAKE2b-256, stdlib) or "blake3" (needs
+the optional `blake3` package). Any other value, or "blake3" without the
+package, is a configuration error: evidence must never be hashed with an
+algorithm other than the one the operator asked for.
+Trees and chains record the algorithm they were built with, so
+verification never depends on the environment it runs in.
+
+Returned digests carry their algorithm too: sha256 ones are bare hex (as
+before TTFR_HASH existed), any other is tagged "<name>:<hex>", so a
+stored hash says how to recompute it (see digest_algorithm()).
+"""
+
+import hashlib
+import os
+from typing import Callable, Dict, Tuple
+
+try:
+    import blake3
+except ImportError:  # optional; only used when TTFR_HASH=blake3
+    blake3 = None
+
+DEFAULT_HASH = "sha256"
+
+
+def _blake2b_256(data: bytes = b""):
+    return hashlib.blake2b(data, digest_size=32)
+
+
+_ALGORITHMS: Dict[str, Callable] = {
+    "sha256": hashlib.sha256,
+    "blake2b": _blake2b_256,
+}
+if blake3 is not None:
+    _ALGORITHMS["blake3"] = blake3.blake3
+
+
+def _configured() -> str:
+    name = os.environ.get("TTFR_HASH") or DEFAULT_HASH
+    if name in _ALGORITHMS:
+        return name
+    if name == "blake3":
+        raise RuntimeError(
+            "TTFR_HASH=blake3 requires the 'blake3' package (pip install blake3)"
+        )
+    raise RuntimeError(
+        f"Unsupported TTFR_HASH={name!r}; expected sha256, blake2b or blake3"
+    )
+
+
+HASH_NAME = _configured()
+
+
+def hasher(name: str = HASH_NAME) -> Callable:
+    """
+    Constructor (hashlib-style: optional initial data) for an algorithm.
+    """
+    try:
+        return _ALGORITHMS[name]
+    except KeyError:
+        raise ValueError(f"Unsupported evidence hash algorithm: {name}") from None
+
+
+def format_digest(name: str, digest: bytes) -> str:
+    """
+    Hex digest, tagged "<name>:" unless name is the default algorithm.
+    """
+    if name == DEFAULT_HASH:
+        return digest.hex()
+    return f"{name}:{digest.hex()}"
+
+
+def digest_algorithm(tagged: str) -> Tuple[str, str]:
+    """
+    (algorithm, hex) for a digest returned by format_digest().
+    """
+    name, sep, hexdigest = tagged.rpartition(":")
+    return (name, hexdigest) if sep else (DEFAULT_HASH, hexdigest)
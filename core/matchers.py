@@ -0,0 +1,27 @@
+"""
+Compiled indicator matchers.
+
+Each indicator family is compiled once into a single case-insensitive
+alternation, so a process image is scanned in one C-level regex pass
+instead of being lowercased and substring-checked per indicator.
+"""
+
+import re
+from typing import Iterable, Pattern
+
+
+def compile_indicators(indicators: Iterable[str]) -> Pattern[str]:
+    """
+    Case-insensitive "any substring" matcher over literal indicators.
+
+    ASCII case folding matches what str.lower() does for ASCII
+    indicators (re.IGNORECASE alone would also fold e.g. U+017F to "s").
+    """
+    return re.compile(
+        "|".join(map(re.escape, indicators)),
+        re.IGNORECASE | re.ASCII,
+    )
+
+
+# Process images that indicate PowerShell execution.
+POWERSHELL_IMAGE = compile_indicators(("powershell",))
@@ -0,0 +1,72 @@
+from typing import List
+
+from .hashing import HASH_NAME, hasher
+
+# RFC 6962 domain separation: a leaf can never be mistaken for a node.
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+
+class IncrementalMerkle:
+    """
+    Append-only binary Merkle tree (RFC 6962 tree hash).
+
+    levels[0] holds leaf hashes; levels[k] holds the roots of every
+    complete 2**k-leaf subtree. An append hashes at most log2(n) nodes,
+    and any prefix root is folded from at most log2(n) cached subtrees.
+    """
+
+    def __init__(self, algorithm: str = HASH_NAME):
+        self.algorithm = algorithm
+        self._new = hasher(algorithm)
+        self.levels: List[List[bytes]] = [[]]
+
+    def _leaf_hash(self, data: bytes) -> bytes:
+        return self._new(_LEAF_PREFIX + data).digest()
+
+    def _node_hash(self, left: bytes, right: bytes) -> bytes:
+        return self._new(_NODE_PREFIX + left + right).digest()
+
+    def __len__(self) -> int:
+        return len(self.levels[0])
+
+    def append(self, leaf: bytes) -> None:
+        node = self._leaf_hash(leaf)
+        levels = self.levels
+        level = 0
+
+        while True:
+            nodes = levels[level]
+            nodes.append(node)
+            if len(nodes) % 2:
+                return
+
+            # Completed a pair: carry its parent one level up.
+            node = self._node_hash(nodes[-2], node)
+            level += 1
+            if level == len(levels):
+                levels.append([])
+
+    def root(self) -> bytes:
+        return self.snapshot_root(len(self))
+
+    def snapshot_root(self, size: int) -> bytes:
+        """
+        Root of the tree over the first `size` leaves.
+        """
+        if not 0 <= size <= len(self):
+            raise ValueError(f"Snapshot size {size} out of range")
+        if size == 0:
+            return self._new(b"").digest()
+
+        # The prefix splits into one complete subtree per set bit of
+        # size; fold them right-to-left (smallest subtree first).
+        acc = None
+        for k, nodes in enumerate(self.levels):
+            count = size >> k
+            if not count:
+                break
+            if count % 2:
+                subtree = nodes[count - 1]
+                acc = subtree if acc is None else self._node_hash(subtree, acc)
+        return acc
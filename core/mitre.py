@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 from typing import List, Dict
 from .event import ForensicEvent
+from .matchers import POWERSHELL_IMAGE
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MitreTechnique:
     """
     MITRE ATT&CK technique instance bound to time.
@@ -30,9 +31,7 @@ class MitreMapper:
         # Process Execution
         # -------------------------------
         if et == "process_start":
-            image = p.get("image", "").lower()
-
-            if "powershell" in image:
+            if POWERSHELL_IMAGE.search(p.get("image", "")):
                 techniques.append(
                     MitreTechnique(
                         technique_id="T1059.001",
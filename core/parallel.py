@@ -0,0 +1,73 @@
+"""
+Multi-process analysis for large replays.
+
+Entity extraction, MITRE mapping and rule evaluation are per-event and
+order-independent, so they run on contiguous slices in worker processes
+and are merged in slice order (set union / list concatenation). The
+evidence hash is order-dependent and stays in the parent, overlapping
+with the workers.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Set, Tuple
+
+from .detections import DetectionHit, DetectionRule
+from .entities import EntityExtractor
+from .event import ForensicEvent
+from .evidence import compute_evidence_hash
+from .mitre import MitreTechnique
+from .pipeline import analyze
+
+# Below this many events per worker, pickling slices costs more than
+# the work it spreads; analyze() runs in-process instead.
+_MIN_EVENTS_PER_WORKER = 20_000
+
+
+def _analyze_slice(
+    events: List[ForensicEvent],
+    rules: Sequence[DetectionRule],
+) -> Tuple[Set, Set, Set, List[MitreTechnique], List[DetectionHit]]:
+    # Entity sets travel back instead of the extractor itself.
+    extractor, techniques, hits, _ = analyze(events, rules)
+    return extractor.processes, extractor.networks, extractor.files, techniques, hits
+
+
+def parallel_analyze(
+    events: List[ForensicEvent],
+    rules: Sequence[DetectionRule] = (),
+    num_workers: Optional[int] = None,
+    with_hash: bool = False,
+) -> Tuple[
+    EntityExtractor, List[MitreTechnique], List[DetectionHit], Optional[str]
+]:
+    """
+    Same result as pipeline.analyze(), computed across worker processes.
+    """
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    num_workers = min(num_workers, len(events) // _MIN_EVENTS_PER_WORKER)
+    if num_workers <= 1:
+        return analyze(events, rules, with_hash=with_hash)
+
+    size = -(-len(events) // num_workers)
+    slices = [events[i:i + size] for i in range(0, len(events), size)]
+    rules = list(rules)
+
+    with ProcessPoolExecutor(max_workers=num_workers) as pool:
+        futures = [pool.submit(_analyze_slice, s, rules) for s in slices]
+
+        evidence_hash = compute_evidence_hash(events) if with_hash else None
+
+        extractor = EntityExtractor()
+        techniques: List[MitreTechnique] = []
+        hits: List[DetectionHit] = []
+        for future in futures:
+            processes, networks, files, slice_techniques, slice_hits = future.result()
+            extractor.processes |= processes
+            extractor.networks |= networks
+            extractor.files |= files
+            techniques.extend(slice_techniques)
+            hits.extend(slice_hits)
+
+    return extractor, techniques, hits, evidence_hash
@@ -0,0 +1,47 @@
+"""
+Fused analysis pass.
+
+Entity extraction, MITRE mapping and retro detections each used to walk
+the full timeline on their own; analyze() feeds all three from a single
+loop, so each event (and its payload) is touched once. The optional
+evidence hash is a single hashing call over the encoded events.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+from .detections import DetectionHit, DetectionRule, index_rules
+from .entities import EntityExtractor
+from .event import ForensicEvent
+from .evidence import compute_evidence_hash
+from .mitre import MitreMapper, MitreTechnique
+
+
+def analyze(
+    events: List[ForensicEvent],
+    rules: Sequence[DetectionRule] = (),
+    with_hash: bool = False,
+) -> Tuple[
+    EntityExtractor, List[MitreTechnique], List[DetectionHit], Optional[str]
+]:
+    """
+    Single pass over events.
+
+    Returns (entities, techniques, hits, evidence_hash). evidence_hash
+    is compute_evidence_hash(events) when with_hash is set, else None.
+    """
+    extractor = EntityExtractor()
+    techniques: List[MitreTechnique] = []
+    hits: List[DetectionHit] = []
+
+    process_event = extractor.process_event
+    map_event = MitreMapper().map_event
+    by_type, wildcard = index_rules(rules)
+
+    for e in events:
+        process_event(e)
+        techniques.extend(map_event(e))
+        for rule in by_type.get(e.event_type, wildcard):
+            hits.extend(rule.evaluate(e))
+
+    evidence_hash = compute_evidence_hash(events) if with_hash else None
+    return extractor, techniques, hits, evidence_hash
@@ -1,6 +1,9 @@
+from operator import attrgetter, le
 from typing import List
 from .event import ForensicEvent
 
+_seq_of = attrgetter("seq")
+
 
 class ReplaySession:
     """
@@ -8,8 +11,13 @@ class ReplaySession:
     """
 
     def __init__(self, events: List[ForensicEvent]):
-        self._events = sorted(events, key=lambda e: e.seq)
+        # TTFR output is already in seq order: check that with C-level
+        # map() calls and only sort (stably, by seq) when it is not.
+        seqs = list(map(_seq_of, events))
+        if all(map(le, seqs, seqs[1:])):
+            self._events = list(events)
+        else:
+            self._events = sorted(events, key=_seq_of)
 
     def replay(self) -> List[ForensicEvent]:
         return self._events
-
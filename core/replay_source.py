@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
+import codecs
 import json
+import mmap
+import os
+from sys import intern
 from typing import Iterable, Protocol
 
 from .ttfr import TTFR
@@ -7,6 +11,26 @@ from .replay import ReplaySession
 from .event import ForensicEvent
 from ttfr.reader import TTFRAdapter
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+# Both parsers accept bytes, so JSONL is parsed without decoding to str.
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Events handed to TTFR.record_many per call.
+_BATCH_SIZE = 4096
+
+
+def _interned(payload) -> dict:
+    """
+    Copy of payload with its str keys interned: the same few keys repeat
+    across every event, so they are stored once and dict probes can hit
+    the identity fast path.
+    """
+    return {intern(k) if type(k) is str else k: v for k, v in payload.items()}
+
 
 # ==================================================
 # Replay Source Contract
@@ -40,27 +64,62 @@ class JsonReplaySource(ReplaySource):
     def load(self) -> ReplaySession:
         ttfr = TTFR()
 
-        with open(self.path, "r") as f:
-            for line_num, line in enumerate(f, start=1):
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    e = json.loads(line)
-                except json.JSONDecodeError as err:
-                    raise RuntimeError(
-                        f"Invalid JSON on line {line_num}: {err}"
-                    ) from err
-
-                ttfr.record(
-                    timestamp=int(e["timestamp"]),
-                    event_type=str(e["type"]),
-                    payload=dict(e.get("payload", {})),
-                )
+        with open(self.path, "rb") as f:
+            # mmap rejects zero-length files; an empty log is no events.
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    self._parse(mm, ttfr)
 
         return ReplaySession(ttfr.snapshot())
 
+    @staticmethod
+    def _parse(mm: mmap.mmap, ttfr: TTFR) -> None:
+        """
+        Split the mapped file on newlines with C-level find() and feed
+        each line's bytes straight to the parser, batching into TTFR.
+        """
+        batch = []
+        find = mm.find
+        size = len(mm)
+
+        # orjson rejects a UTF-8 BOM; skip it up front.
+        pos = len(codecs.BOM_UTF8) if mm[:3] == codecs.BOM_UTF8 else 0
+        line_num = 0
+
+        while pos < size:
+            nl = find(b"\n", pos)
+            if nl == -1:
+                nl = size
+            line = mm[pos:nl]
+            pos = nl + 1
+            line_num += 1
+
+            if not line or line.isspace():
+                continue
+
+            try:
+                e = _loads(line)
+            except json.JSONDecodeError as err:
+                raise RuntimeError(
+                    f"Invalid JSON on line {line_num}: {err}"
+                ) from err
+
+            # A decoded JSON object is already a private dict. orjson also
+            # reuses key objects across documents, while stdlib json only
+            # shares them within one, so only its keys are interned here.
+            payload = e.get("payload", {})
+            if type(payload) is not dict:
+                payload = dict(payload)
+            if orjson is None:
+                payload = _interned(payload)
+
+            batch.append((int(e["timestamp"]), str(e["type"]), payload))
+            if len(batch) >= _BATCH_SIZE:
+                ttfr.record_many(batch)
+                batch = []
+
+        ttfr.record_many(batch)
+
 
 # ==================================================
 # TTFR Replay Source (REAL IMPLEMENTATION)
@@ -84,7 +143,7 @@ class TTFRReplaySource(ReplaySource):
             ttfr.record(
                 timestamp=int(e.timestamp),
                 event_type=str(e.type),
-                payload=dict(e.payload),
+                payload=_interned(e.payload),
             )
 
         return ReplaySession(ttfr.snapshot())
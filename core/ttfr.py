@@ -1,5 +1,59 @@
-from typing import List
+from collections.abc import Sequence
+from itertools import islice
+from operator import eq as operator_eq
+from sys import intern
+from typing import Iterable, List, Optional, Tuple
 from .event import ForensicEvent
+from .hashing import format_digest
+from .merkle import IncrementalMerkle
+
+
+class SnapshotView(Sequence):
+    """
+    Read-only, length-bounded view of a TTFR's event list.
+
+    TTFR only appends and events are frozen, so the first `length`
+    entries never change: taking a snapshot is O(1) instead of a copy.
+    Slicing returns a plain list.
+    """
+
+    __slots__ = ("_events", "_length")
+
+    def __init__(self, events: List[ForensicEvent], length: int):
+        self._events = events
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        return islice(self._events, self._length)
+
+    def __getitem__(self, index):
+        n = self._length
+        if isinstance(index, slice):
+            start, stop, step = index.indices(n)
+            if step == 1:
+                return self._events[start:stop]
+            return [self._events[i] for i in range(start, stop, step)]
+
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("snapshot index out of range")
+        return self._events[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (SnapshotView, list, tuple)):
+            return len(self) == len(other) and all(
+                map(operator_eq, self, other)
+            )
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"SnapshotView({list(self)!r})"
 
 
 class TTFR:
@@ -10,20 +64,60 @@ class TTFR:
     def __init__(self):
         self._events: List[ForensicEvent] = []
         self._seq = 0
+        self._merkle = IncrementalMerkle()
 
     def record(self, timestamp: int, event_type: str, payload: dict) -> None:
         event = ForensicEvent(
             seq=self._seq,
             timestamp=timestamp,
-            event_type=event_type,
+            event_type=intern(event_type),
             payload=payload,
         )
         self._events.append(event)
         self._seq += 1
 
-    def snapshot(self) -> List[ForensicEvent]:
+    def record_many(self, batch: Iterable[Tuple[int, str, dict]]) -> None:
+        """
+        Record (timestamp, event_type, payload) tuples in order.
+
+        Equivalent to calling record() per tuple, minus the per-event
+        method call and attribute lookups.
         """
-        Immutable snapshot of recorded events.
+        seq = self._seq
+        events = [
+            ForensicEvent(
+                seq=seq + i,
+                timestamp=timestamp,
+                event_type=intern(event_type),
+                payload=payload,
+            )
+            for i, (timestamp, event_type, payload) in enumerate(batch)
+        ]
+
+        self._events.extend(events)
+        self._seq = seq + len(events)
+
+    def snapshot(self) -> SnapshotView:
+        """
+        Immutable snapshot of recorded events (O(1); see SnapshotView).
+        """
+        return SnapshotView(self._events, len(self._events))
+
+    def evidence_hash(self, size: Optional[int] = None) -> str:
+        """
+        Merkle evidence hash over the first `size` events (default: all).
+
+        A Merkle root (RFC 6962), not compute_evidence_hash()'s flat
+        digest: the tree persists between calls, so each call only hashes
+        events recorded since the last one and any prefix can be rooted.
         """
-        return list(self._events)
+        if size is None:
+            size = len(self._events)
 
+        # The tree is only built when a hash is asked for, and then only
+        # extended with events recorded since the last call.
+        tree = self._merkle
+        append = tree.append
+        for event in islice(self._events, len(tree), size):
+            append(event._encoded)
+        return format_digest(tree.algorithm, tree.snapshot_root(size))
@@ -0,0 +1,111 @@
+import sqlite3
+import unittest
+from unittest import mock
+
+from case_db import blackbox
+from case_db.blackbox import BlackboxDAO
+
+
+def _entry(n: int) -> dict:
+    return {
+        "case_id": "case",
+        "snapshot_id": "snap",
+        "entry_type": "note",
+        "title": f"entry {n}",
+        "body": "",
+        "tags": ["t"],
+    }
+
+
+class BlackboxDAOTest(unittest.TestCase):
+    def setUp(self):
+        self.dao = BlackboxDAO(":memory:")
+        self.addCleanup(self.dao.close)
+
+    def _fail_audit_inserts(self):
+        self.dao._conn().execute(
+            """
+            CREATE TRIGGER fail_audit BEFORE INSERT ON audit_log
+            BEGIN SELECT RAISE(ABORT, 'audit insert failed'); END
+            """
+        )
+
+    def _create_work_order(self) -> int:
+        return self.dao.create_work_order(
+            case_id="case", snapshot_id="snap", title="wo", description=""
+        )
+
+    def test_bulk_append_returns_contiguous_ids(self):
+        self.dao.append_entry(**_entry(0))
+        ids = self.dao.append_entries_bulk([_entry(n) for n in range(1, 6)])
+
+        self.assertEqual(ids, list(range(ids[0], ids[0] + 5)))
+        stored = {e.id: e.title for e in self.dao.list_entries("case", "snap")}
+        self.assertEqual([stored[i] for i in ids], [f"entry {n}" for n in range(1, 6)])
+
+        audited = [
+            a["details"]["entry_id"]
+            for a in self.dao.list_audit("case", "snap")
+            if a["action"] == "blackbox_entry_appended"
+        ]
+        self.assertEqual(sorted(audited), sorted(ids + [ids[0] - 1]))
+
+    def test_bulk_append_rolls_back_when_audit_fails(self):
+        self._fail_audit_inserts()
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.dao.append_entries_bulk([_entry(n) for n in range(3)])
+        self.assertEqual(self.dao.list_entries("case", "snap"), [])
+
+    def test_work_order_rolls_back_when_audit_fails(self):
+        self._fail_audit_inserts()
+        with self.assertRaises(sqlite3.IntegrityError):
+            self._create_work_order()
+        self.assertEqual(self.dao.list_work_orders("case", "snap"), [])
+
+
+class UpdateWorkOrderStatusTest(unittest.TestCase):
+    has_json = False
+
+    def setUp(self):
+        patcher = mock.patch.object(blackbox, "_HAS_JSON", self.has_json)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.dao = BlackboxDAO(":memory:")
+        self.addCleanup(self.dao.close)
+
+    def _status_audits(self):
+        return [
+            a
+            for a in self.dao.list_audit("case", "snap")
+            if a["action"] == "work_order_status_updated"
+        ]
+
+    def test_missing_work_order_is_a_no_op(self):
+        self.dao.update_work_order_status(404, "closed")
+        self.assertEqual(self._status_audits(), [])
+
+    def test_existing_work_order_is_updated_and_audited(self):
+        wo_id = self.dao.create_work_order(
+            case_id="case", snapshot_id="snap", title="wo", description=""
+        )
+        self.dao.update_work_order_status(wo_id, " closed ", actor="lead")
+
+        (wo,) = self.dao.list_work_orders("case", "snap")
+        self.assertEqual(wo.status, "CLOSED")
+
+        (audit,) = self._status_audits()
+        self.assertEqual(audit["actor"], "lead")
+        self.assertEqual(
+            audit["details"], {"work_order_id": wo_id, "from": "OPEN", "to": "CLOSED"}
+        )
+
+
+@unittest.skipUnless(
+    sqlite3.sqlite_version_info >= (3, 38, 0), "SQLite JSON functions need 3.38+"
+)
+class UpdateWorkOrderStatusJsonTest(UpdateWorkOrderStatusTest):
+    has_json = True
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import unittest
+
+from core.detections import (
+    DetectionHit,
+    DetectionRule,
+    RetroDetectionEngine,
+    SuspiciousC2ConnectionRule,
+    SuspiciousPowerShellRule,
+)
+from core.ttfr import TTFR
+
+
+class QuietPowerShellRule(SuspiciousPowerShellRule):
+    def evaluate(self, event):
+        return []
+
+
+class EveryThirdEventRule(DetectionRule):
+    rule_id = "TEST-WILDCARD"
+
+    def evaluate(self, event):
+        if event.seq % 3:
+            return []
+        return [DetectionHit(self.rule_id, "", event.seq, event.timestamp, "")]
+
+
+def _sample_ttfr() -> TTFR:
+    ttfr = TTFR()
+    payloads = [
+        ("process_start", {"pid": 1, "image": "C:\\Windows\\PowerShell.exe"}),
+        ("process_start", {"pid": 2, "image": "cmd.exe"}),
+        ("process_start", {}),
+        ("network_connect", {"dst": "10.0.0.1", "port": 443}),
+        ("network_connect", {"dst": "10.0.0.2", "port": 4444}),
+        ("network_connect", {"dst": "10.0.0.3", "port": "8080"}),
+        ("network_connect", {}),
+        ("file_write", {"path": "/tmp/x"}),
+        ("dns_query", {"name": "example.com"}),
+    ]
+    for i in range(3):
+        for event_type, payload in payloads:
+            ttfr.record(i, event_type, dict(payload))
+    return ttfr
+
+
+def _per_rule(rules, events):
+    return [hit for e in events for rule in rules for hit in rule.evaluate(e)]
+
+
+class CompiledRulesTest(unittest.TestCase):
+    def assert_matches_evaluate(self, rules):
+        events = list(_sample_ttfr().snapshot())
+        expected = _per_rule(rules, events)
+        self.assertEqual(RetroDetectionEngine(rules).run(events), expected)
+
+    def test_builtin_rules(self):
+        self.assert_matches_evaluate(
+            [SuspiciousPowerShellRule(), SuspiciousC2ConnectionRule()]
+        )
+
+    def test_mixed_with_wildcard(self):
+        self.assert_matches_evaluate(
+            [
+                EveryThirdEventRule(),
+                SuspiciousC2ConnectionRule(),
+                SuspiciousPowerShellRule(),
+            ]
+        )
+
+    def test_wildcard_only(self):
+        self.assert_matches_evaluate([EveryThirdEventRule()])
+
+    def test_subclass_evaluate_override_is_honoured(self):
+        rule = QuietPowerShellRule()
+        self.assertFalse(rule.inlinable())
+        self.assert_matches_evaluate([rule])
+        self.assertEqual(
+            RetroDetectionEngine([rule]).run(list(_sample_ttfr().snapshot())), []
+        )
+
+    def test_rules_changed_after_construction(self):
+        events = list(_sample_ttfr().snapshot())
+        engine = RetroDetectionEngine([SuspiciousPowerShellRule()])
+        engine.run(events)
+
+        engine.rules.append(SuspiciousC2ConnectionRule())
+        self.assertEqual(engine.run(events), _per_rule(engine.rules, events))
+
+
+class InlineSourceTest(unittest.TestCase):
+    def test_escaping_statements_are_rejected(self):
+        for stmt in ("return", "continue", "break"):
+            with self.subTest(stmt=stmt):
+                with self.assertRaises(ValueError):
+
+                    class EscapingRule(DetectionRule):
+                        applies_to = ("process_start",)
+                        inline_source = f"""
+                            if not p:
+                                {stmt}
+                        """
+
+    def test_own_loops_and_functions_are_allowed(self):
+        class LoopingRule(DetectionRule):
+            rule_id = "TEST-LOOP"
+            applies_to = ("network_connect",)
+            inline_source = """
+                def port_of(payload):
+                    return payload.get("port")
+                for key in p:
+                    if key != "port":
+                        continue
+                    append(DetectionHit(rule.rule_id, "", e.seq, e.timestamp, str(port_of(p))))
+                    break
+            """
+
+        events = list(_sample_ttfr().snapshot())
+        rules = [LoopingRule()]
+        self.assertTrue(_per_rule(rules, events))
+        self.assertEqual(RetroDetectionEngine(rules).run(events), _per_rule(rules, events))
+
+    def test_engine_rejects_escaping_block_on_inlinable_rule(self):
+        class EscapingRule(DetectionRule):
+            applies_to = ("process_start",)
+            inline_source = "return"
+
+            def evaluate(self, event):
+                return []
+
+        with self.assertRaises(ValueError):
+            RetroDetectionEngine([EscapingRule()])
+
+
+if __name__ == "__main__":
+    unittest.main()
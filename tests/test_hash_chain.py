@@ -0,0 +1,70 @@
+import unittest
+
+from core.evidence import compute_evidence_hash
+from core.hash_chain import EvidenceChain
+from core.hashing import digest_algorithm
+from core.ttfr import TTFR
+
+
+def _log(sign: int, n: int = 5) -> TTFR:
+    ttfr = TTFR()
+    for i in range(n):
+        ttfr.record(i, "file_write", {"path": str(sign * i)})
+    return ttfr
+
+
+class EvidenceChainTest(unittest.TestCase):
+    def test_growing_snapshots_verify(self):
+        ttfr = _log(1)
+        chain = EvidenceChain()
+        chain.add_snapshot(ttfr.snapshot())
+        ttfr.record(9, "file_write", {"path": "late"})
+        chain.add_snapshot(ttfr.snapshot())
+        self.assertTrue(chain.verify())
+
+    def test_rejects_snapshot_of_a_different_log(self):
+        chain = EvidenceChain()
+        chain.add_snapshot(_log(1).snapshot())
+        with self.assertRaises(ValueError):
+            chain.add_snapshot(_log(-1).snapshot())
+
+    def test_rejects_shorter_snapshot(self):
+        chain = EvidenceChain()
+        chain.add_snapshot(_log(1).snapshot())
+        with self.assertRaises(ValueError):
+            chain.add_snapshot([])
+
+    def test_rejects_unsorted_events(self):
+        events = list(_log(1).snapshot())
+        with self.assertRaises(ValueError):
+            EvidenceChain().add_snapshot(events[::-1])
+
+    def test_tampered_link_fails_verification(self):
+        chain = EvidenceChain()
+        chain.add_snapshot(_log(1).snapshot())
+        chain._chain[0] = "0" * 64
+        self.assertFalse(chain.verify())
+
+
+class DigestTagTest(unittest.TestCase):
+    def test_default_digests_are_bare_hex(self):
+        events = _log(1).snapshot()
+        self.assertEqual(len(compute_evidence_hash(events, "sha256")), 64)
+        self.assertEqual(len(EvidenceChain("sha256").add_snapshot(events)), 64)
+
+    def test_other_algorithms_are_tagged(self):
+        events = _log(1).snapshot()
+        chain = EvidenceChain("blake2b")
+        self.assertTrue(chain.add_snapshot(events).startswith("blake2b:"))
+        self.assertTrue(chain.verify())
+
+        stored = compute_evidence_hash(events, "blake2b")
+        algorithm, hexdigest = digest_algorithm(stored)
+        self.assertEqual(algorithm, "blake2b")
+        self.assertEqual(len(hexdigest), 64)
+        self.assertEqual(compute_evidence_hash(events, algorithm), stored)
+        self.assertNotEqual(compute_evidence_hash(events, "sha256"), stored)
+
+
+if __name__ == "__main__":
+    unittest.main()